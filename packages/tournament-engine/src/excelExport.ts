@@ -188,16 +188,8 @@ export function exportRowsToTSV(rows: ExcelExportRow[]): string {
 function escapeTSVField(value: string): string {
   if (!value) return value;
 
-  // Replace tabs with spaces
-  let escaped = value.replace(/\t/g, ' ');
-
-  // Replace newlines with spaces
-  escaped = escaped.replace(/\n/g, ' ');
-
-  // Replace carriage returns with spaces
-  escaped = escaped.replace(/\r/g, ' ');
-
-  return escaped;
+  // Replace tabs, newlines and carriage returns with spaces in a single pass
+  return value.replace(/[\t\n\r]/g, ' ');
 }
 
 /**